@@ -287,10 +287,12 @@ class ServerManager: ObservableObject {
         }
     }
     
+    // Compiled once and shared across all prerequisite checks
+    private static let versionRegex = try? NSRegularExpression(pattern: #"v?(\d+\.\d+(?:\.\d+)?)"#, options: [])
+
     private func extractVersion(from output: String) -> String? {
         // Simple version extraction - look for patterns like "v1.2.3" or "1.2.3"
-        let versionPattern = #"v?(\d+\.\d+(?:\.\d+)?)"#
-        let regex = try? NSRegularExpression(pattern: versionPattern, options: [])
+        let regex = Self.versionRegex
         let nsString = output as NSString
         let results = regex?.matches(in: output, options: [], range: NSRange(location: 0, length: nsString.length))
         